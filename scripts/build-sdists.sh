@@ -2,22 +2,73 @@
 
 DBT_PATH="$( cd "$(dirname "$0")/.." ; pwd -P )"
 
+PYTHON_BIN=${PYTHON_BIN:-python}
+
+# resolve the interpreter once, and fail loudly up front if it's missing
+if ! PYTHON_PATH="$(command -v "$PYTHON_BIN")"; then
+    echo "Could not find python executable: ${PYTHON_BIN}"
+    exit 1
+fi
+PYTHON_BIN="$PYTHON_PATH"
+
 echo $SCRIPTPATH
+echo $PYTHON_BIN
+
+LOG_PATH="$(mktemp -d)"
+trap 'rm -rf "$LOG_PATH"' EXIT
+
+SUBPATHS="core plugins/postgres plugins/redshift plugins/bigquery plugins/snowflake"
 
 set -x
 
 rm -rf "$DBT_PATH"/dist
 mkdir -p "$DBT_PATH"/dist
 
-for SUBPATH in core plugins/postgres plugins/redshift plugins/bigquery plugins/snowflake
+# the subpackages don't depend on each other, so build them all at once and
+# keep each build's output in its own log so it stays readable
+PIDS=()
+for SUBPATH in $SUBPATHS
+do
+    (
+        rm -rf "$DBT_PATH"/"$SUBPATH"/dist
+        cd "$DBT_PATH"/"$SUBPATH"
+        $PYTHON_BIN setup.py sdist
+    ) > "$LOG_PATH"/"${SUBPATH//\//-}".log 2>&1 &
+    PIDS+=($!)
+done
+
+set +x
+
+FAILED=0
+i=0
+for SUBPATH in $SUBPATHS
+do
+    if ! wait "${PIDS[$i]}"; then
+        echo "Build failed for $SUBPATH"
+        FAILED=1
+    fi
+    echo "----- $SUBPATH -----"
+    cat "$LOG_PATH"/"${SUBPATH//\//-}".log
+    i=$((i + 1))
+done
+
+if [ "$FAILED" -ne 0 ]; then
+    exit 1
+fi
+
+set -x
+
+# everything is on one filesystem, so link the dists instead of copying them
+for SUBPATH in $SUBPATHS
 do
-    rm -rf "$DBT_PATH"/"$SUBPATH"/dist
-    cd "$DBT_PATH"/"$SUBPATH"
-    python setup.py sdist
-    cp -r "$DBT_PATH"/"$SUBPATH"/dist/* "$DBT_PATH"/dist/
+    for PACKAGE in "$DBT_PATH"/"$SUBPATH"/dist/*
+    do
+        ln "$PACKAGE" "$DBT_PATH"/dist/ 2>/dev/null || cp "$PACKAGE" "$DBT_PATH"/dist/
+    done
 done
 
+# the root package has to be built last, on its own
 cd "$DBT_PATH"
-python setup.py sdist
+$PYTHON_BIN setup.py sdist
 
 set +x